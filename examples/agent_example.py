@@ -59,35 +59,48 @@ async def main():
         )
 
     console.print("\n▶️ [highlight] Navigating[/] to Google")
-    await stagehand.page.goto("https://google.com/")
-    console.print("✅ [success]Navigated to Google[/]")
-    
+    # Start navigation as a task and build the agent while the CDP round-trip
+    # is in flight; the navigation is only awaited right before it is needed.
+    goto_task = asyncio.create_task(stagehand.page.goto("https://google.com/"))
+
     console.print("\n▶️ [highlight] Using Agent to perform a task[/]: playing a game of 2048")
     agent = stagehand.agent(
         model="computer-use-preview",
         instructions="You are a helpful web navigation assistant that helps users find information. You are currently on the following page: google.com. Do not ask follow up questions, the user will trust your judgement.",
         options={"apiKey": os.getenv("MODEL_API_KEY")}
     )
+    await goto_task
+    console.print("✅ [success]Navigated to Google[/]")
+
     agent_result = await agent.execute(
         instruction="Play a game of 2048",
         max_steps=20,
         auto_screenshot=True,
     )
 
-    console.print("📊 [info]Agent execution result:[/]")
-    console.print(f"✅ Success: [bold]{'Yes' if agent_result.success else 'No'}[/]")
-    console.print(f"🎯 Completed: [bold]{'Yes' if agent_result.completed else 'No'}[/]")
+    # Build the whole result summary once and emit it with a single
+    # console.print, instead of one formatting pass + flush per line.
+    summary_lines = [
+        "📊 [info]Agent execution result:[/]",
+        f"✅ Success: [bold]{'Yes' if agent_result.success else 'No'}[/]",
+        f"🎯 Completed: [bold]{'Yes' if agent_result.completed else 'No'}[/]",
+    ]
     if agent_result.message:
-        console.print(f"💬 Message: [italic]{agent_result.message}[/]")
-    
+        summary_lines.append(f"💬 Message: [italic]{agent_result.message}[/]")
+
     if agent_result.actions:
-        console.print(f"🔄 Actions performed: [bold]{len(agent_result.actions)}[/]")
-        for i, action in enumerate(agent_result.actions):
-            console.print(f"  Action {i+1}: {action.get('type', 'Unknown')} - {action.get('description', 'No description')}")
-    
+        summary_lines.append(
+            f"🔄 Actions performed: [bold]{len(agent_result.actions)}[/]"
+        )
+        summary_lines.extend(
+            f"  Action {i+1}: {action.get('type', 'Unknown')} - {action.get('description', 'No description')}"
+            for i, action in enumerate(agent_result.actions)
+        )
+
     # For debugging, you can also print the full JSON
-    console.print("[dim]Full response JSON:[/]")
-    console.print_json(f"{agent_result.model_dump_json()}")
+    summary_lines.append("[dim]Full response JSON:[/]")
+    console.print("\n".join(summary_lines))
+    console.print_json(agent_result.model_dump_json())
 
     # Close the session
     console.print("\n⏹️  [warning]Closing session...[/]")
@@ -2,10 +2,7 @@
 
 from importlib.metadata import version as get_version
 
-from .agent import Agent
 from .config import StagehandConfig, default_config
-from .handlers.observe_handler import ObserveHandler
-from .llm import LLMClient
 from .logging import LogConfig, configure_logging
 from .main import Stagehand
 from .metrics import StagehandFunctionName, StagehandMetrics
@@ -25,6 +22,25 @@ from .schemas import (
 
 __version__ = get_version("stagehand")
 
+# Heavy re-exports (provider SDKs, litellm) resolved lazily via PEP 562 so
+# `import stagehand` doesn't pay their import cost up front.
+_LAZY_IMPORTS = {
+    "Agent": ".agent",
+    "LLMClient": ".llm",
+    "ObserveHandler": ".handlers.observe_handler",
+}
+
+
+def __getattr__(name):
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
 __all__ = [
     "Stagehand",
     "StagehandConfig",
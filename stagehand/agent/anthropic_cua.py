@@ -112,6 +112,18 @@ class AnthropicCUAClient(AgentClient):
                 },
             },
         ]
+        # Mark the end of the static prefix (system prompt + tool schema) with a
+        # cache_control breakpoint so the provider reuses its KV cache across
+        # steps instead of re-prefilling the identical prefix on every turn.
+        self.tools[-1]["cache_control"] = {"type": "ephemeral"}
+        self.system = [
+            {
+                "type": "text",
+                "text": (self.instructions or "")
+                + "Remember to call the computer tools, and only goto or navigate_back if you need to. Screenshots, clicks, etc, will be parsed from computer tool calls",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
         self.max_tokens = kwargs.get("max_tokens", 1024)
         self.last_tool_use_ids = None
         self.logger.info(
@@ -171,8 +183,7 @@ class AnthropicCUAClient(AgentClient):
                 response = self.anthropic_sdk_client.beta.messages.create(
                     model=self.model,
                     max_tokens=self.max_tokens,
-                    system=self.instructions
-                    + "Remember to call the computer tools, and only goto or navigate_back if you need to. Screenshots, clicks, etc, will be parsed from computer tool calls",  # System prompt
+                    system=self.system,  # Cached system prompt blocks
                     messages=current_messages,
                     tools=self.tools,
                     betas=self.beta_flag,
@@ -1,6 +1,7 @@
 import asyncio
 import json
 import os
+import uuid
 from typing import Any, Optional
 
 from dotenv import load_dotenv
@@ -77,6 +78,10 @@ class OpenAICUAClient(AgentClient):
             },
         ]
         self.last_openai_tool_calls: Optional[list[Any]] = None
+        # Stable cache key so the provider routes every step of a task to the
+        # same prompt cache; the shared system/tool prefix is then only
+        # prefilled once instead of on every step.
+        self.prompt_cache_key = f"stagehand-cua-{uuid.uuid4().hex}"
 
     def format_screenshot(self, screenshot_base64: str) -> dict:
         """Formats a screenshot for the OpenAI CUA model."""
@@ -388,6 +393,7 @@ class OpenAICUAClient(AgentClient):
                     tools=self.tools,
                     reasoning={"summary": "concise"},
                     truncation="auto",
+                    extra_body={"prompt_cache_key": self.prompt_cache_key},
                 )
                 end_time = asyncio.get_event_loop().time()
                 total_inference_time_ms += int((end_time - start_time) * 1000)
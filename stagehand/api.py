@@ -1,12 +1,62 @@
 import json
+import sys
 from datetime import datetime
 from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 
+import httpx
+
 from .metrics import StagehandMetrics
 from .utils import convert_dict_keys_to_camel_case
 
-__all__ = ["_create_session", "_execute", "_get_replay_metrics"]
+try:
+    # Optional fast decoders for the streamed SSE frames, preferred in order:
+    # a reusable msgspec Decoder, then orjson, then stdlib json. All raise
+    # ValueError subclasses on malformed input, so error handling is shared.
+    # Typed msgspec Structs were considered for the message envelope, but
+    # _handle_log and external log callbacks consume plain dicts with
+    # free-form auxiliary data, so frames stay untyped.
+    from msgspec.json import Decoder as _MsgspecDecoder
+    from msgspec.json import Encoder as _MsgspecEncoder
+
+    _json_loads = _MsgspecDecoder().decode
+    _json_dumps = _MsgspecEncoder().encode
+except ImportError:
+    try:
+        from orjson import dumps as _json_dumps
+        from orjson import loads as _json_loads
+    except ImportError:
+        _json_loads = json.loads
+
+        def _json_dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode("utf-8")
+
+__all__ = [
+    "_create_session",
+    "_execute",
+    "_get_replay_metrics",
+    "_get_replay_metrics_sync",
+]
+
+# Interned comparands for the per-frame dispatch in _execute; interning keeps
+# the dict-lookup/compare fast path on identity where the decoder returns
+# interned strings, and costs nothing where it doesn't.
+_T_SYSTEM = sys.intern("system")
+_T_LOG = sys.intern("log")
+_S_ERROR = sys.intern("error")
+_S_FINISHED = sys.intern("finished")
+
+# Session create params sent when the caller didn't supply any; hoisted so the
+# nested dict isn't rebuilt on every _create_session call.
+_DEFAULT_BB_SESSION_CREATE_PARAMS = {
+    "browserSettings": {
+        "blockAds": True,
+        "viewport": {
+            "width": 1024,
+            "height": 768,
+        },
+    },
+}
 
 
 async def _create_session(self):
@@ -21,53 +71,33 @@ async def _create_session(self):
     if not self.model_api_key:
         raise ValueError("model_api_key is required to create a session.")
 
-    browserbase_session_create_params = (
-        convert_dict_keys_to_camel_case(self.browserbase_session_create_params)
-        if self.browserbase_session_create_params
-        else None
-    )
-
     payload = {
         "modelName": self.model_name,
         "verbose": 2 if self.verbose == 3 else self.verbose,
         "domSettleTimeoutMs": self.dom_settle_timeout_ms,
         "browserbaseSessionID": self.session_id,
+        # camelCased once in __init__ rather than per session start
         "browserbaseSessionCreateParams": (
-            browserbase_session_create_params
-            if browserbase_session_create_params
-            else {
-                "browserSettings": {
-                    "blockAds": True,
-                    "viewport": {
-                        "width": 1024,
-                        "height": 768,
-                    },
-                },
-            }
+            self._bb_params_camel or _DEFAULT_BB_SESSION_CREATE_PARAMS
         ),
     }
 
-    # Add the new parameters if they have values
-    if hasattr(self, "self_heal") and self.self_heal is not None:
-        payload["selfHeal"] = self.self_heal
-
-    if (
-        hasattr(self, "wait_for_captcha_solves")
-        and self.wait_for_captcha_solves is not None
-    ):
-        payload["waitForCaptchaSolves"] = self.wait_for_captcha_solves
-
-    if hasattr(self, "act_timeout_ms") and self.act_timeout_ms is not None:
-        payload["actTimeoutMs"] = self.act_timeout_ms
-
-    if hasattr(self, "system_prompt") and self.system_prompt:
-        payload["systemPrompt"] = self.system_prompt
-
-    if hasattr(self, "model_client_options") and self.model_client_options:
-        payload["modelClientOptions"] = self.model_client_options
-
-    if hasattr(self, "experimental") and self.experimental:
-        payload["experimental"] = self.experimental
+    # Add the optional parameters if they have values. All of these
+    # attributes are set unconditionally in __init__, so no hasattr guards.
+    payload.update(
+        {
+            key: value
+            for key, value in (
+                ("selfHeal", self.self_heal),
+                ("waitForCaptchaSolves", self.wait_for_captcha_solves),
+                ("actTimeoutMs", self.act_timeout_ms),
+                ("systemPrompt", self.system_prompt or None),
+                ("modelClientOptions", self.model_client_options or None),
+                ("experimental", self.experimental or None),
+            )
+            if value is not None
+        }
+    )
 
     def get_version(package_str):
         try:
@@ -87,10 +117,11 @@ async def _create_session(self):
         "x-sdk-version": get_version("stagehand"),
     }
 
-    # async with self._client:
+    # Encode the body with the fast serializer; Content-Type is already
+    # application/json in the headers above.
     resp = await self._client.post(
-        f"{self.api_url}/sessions/start",
-        json=payload,
+        "/sessions/start",
+        content=_json_dumps(payload),
         headers=headers,
     )
     if resp.status_code != 200:
@@ -109,16 +140,9 @@ async def _execute(self, method: str, payload: dict[str, Any]) -> Any:
     Streams line-by-line, returning the 'result' from the final message (if any).
     """
     headers = {
-        "x-bb-api-key": self.browserbase_api_key,
-        "x-bb-project-id": self.browserbase_project_id,
-        "Content-Type": "application/json",
-        "Connection": "keep-alive",
+        **self._execute_headers,
         "x-sent-at": datetime.now().isoformat(),
-        # Always enable streaming for better log handling
-        "x-stream-response": "true",
     }
-    if self.model_api_key:
-        headers["x-model-api-key"] = self.model_api_key
 
     payload_options = payload.get("modelClientOptions", {})
     instance_options = self.model_client_options or {}
@@ -139,20 +163,29 @@ async def _execute(self, method: str, payload: dict[str, Any]) -> Any:
 
     # Convert snake_case keys to camelCase for the API
     modified_payload = convert_dict_keys_to_camel_case(payload)
-    print(modified_payload)
 
-    # async with self._client:
     try:
         # Always use streaming for consistent log handling
         async with self._client.stream(
             "POST",
-            f"{self.api_url}/sessions/{self.session_id}/{method}",
-            json=modified_payload,
+            f"/sessions/{self.session_id}/{method}",
+            content=_json_dumps(modified_payload),
             headers=headers,
         ) as response:
             if response.status_code != 200:
-                error_text = await response.aread()
-                error_message = error_text.decode("utf-8")
+                # Read at most a few KB of the error body; it only feeds the
+                # log line and RuntimeError message, so an arbitrarily large
+                # or malformed error response shouldn't be buffered wholesale.
+                error_chunks = []
+                error_len = 0
+                async for chunk in response.aiter_bytes(8192):
+                    error_chunks.append(chunk)
+                    error_len += len(chunk)
+                    if error_len >= 8192:
+                        break
+                error_message = (
+                    b"".join(error_chunks)[:8192].decode("utf-8", errors="replace")
+                )
                 self.logger.error(
                     f"[HTTP ERROR] Status {response.status_code}: {error_message}"
                 )
@@ -161,37 +194,51 @@ async def _execute(self, method: str, payload: dict[str, Any]) -> Any:
                 )
             result = None
 
-            async for line in response.aiter_lines():
-                # Skip empty lines
-                if not line.strip():
+            # Split the stream on raw newlines instead of aiter_lines, which
+            # buffers and UTF-8-decodes every frame to str in Python before
+            # we parse it; the JSON decoder accepts bytes directly.
+            async def aiter_raw_lines():
+                buf = bytearray()
+                async for chunk in response.aiter_bytes(65536):
+                    buf += chunk
+                    while (newline := buf.find(b"\n")) != -1:
+                        yield bytes(buf[:newline])
+                        del buf[: newline + 1]
+                if buf:
+                    yield bytes(buf)
+
+            async for line in aiter_raw_lines():
+                # Skip empty lines (keep-alive frames are b"" or b"\r").
+                # isspace() replaces the per-frame strip() allocation; the
+                # JSON decoders all tolerate a trailing \r as whitespace.
+                if not line or line.isspace():
                     continue
 
                 try:
                     # Handle SSE-style messages that start with "data: "
-                    if line.startswith("data: "):
-                        line = line[len("data: ") :]
+                    if line.startswith(b"data: "):
+                        line = line[len(b"data: ") :]
 
-                    message = json.loads(line)
+                    message = _json_loads(line)
                     # Handle different message types
                     msg_type = message.get("type")
 
-                    if msg_type == "system":
-                        status = message.get("data", {}).get("status")
-                        if status == "error":
-                            error_msg = message.get("data", {}).get(
-                                "error", "Unknown error"
-                            )
+                    if msg_type == _T_SYSTEM:
+                        data = message.get("data", {})
+                        status = data.get("status")
+                        if status == _S_ERROR:
+                            error_msg = data.get("error", "Unknown error")
                             self.logger.error(f"[ERROR] {error_msg}")
                             raise RuntimeError(f"Server returned error: {error_msg}")
-                        elif status == "finished":
-                            result = message.get("data", {}).get("result")
-                    elif msg_type == "log":
+                        elif status == _S_FINISHED:
+                            result = data.get("result")
+                    elif msg_type == _T_LOG:
                         # Process log message using _handle_log
                         await self._handle_log(message)
                     else:
                         # Log any other message types
                         self.logger.debug(f"[UNKNOWN] Message type: {msg_type}")
-                except json.JSONDecodeError:
+                except ValueError:
                     self.logger.error(f"Could not parse line as JSON: {line}")
 
             # Return the final result
@@ -217,7 +264,7 @@ async def _get_replay_metrics(self):
 
     try:
         response = await self._client.get(
-            f"{self.api_url}/sessions/{self.session_id}/replay",
+            f"/sessions/{self.session_id}/replay",
             headers=headers,
         )
 
@@ -239,49 +286,99 @@ async def _get_replay_metrics(self):
                 f"Failed to fetch metrics: {data.get('error', 'Unknown error')}"
             )
 
-        # Parse the API data into StagehandMetrics format
-        api_data = data.get("data", {})
-        metrics = StagehandMetrics()
-
-        # Parse pages and their actions
-        pages = api_data.get("pages", [])
-        for page in pages:
-            actions = page.get("actions", [])
-            for action in actions:
-                # Get method name and token usage
-                method = action.get("method", "").lower()
-                token_usage = action.get("tokenUsage", {})
-
-                if token_usage:
-                    input_tokens = token_usage.get("inputTokens", 0)
-                    output_tokens = token_usage.get("outputTokens", 0)
-                    time_ms = token_usage.get("timeMs", 0)
-
-                    # Map method to metrics fields
-                    if method == "act":
-                        metrics.act_prompt_tokens += input_tokens
-                        metrics.act_completion_tokens += output_tokens
-                        metrics.act_inference_time_ms += time_ms
-                    elif method == "extract":
-                        metrics.extract_prompt_tokens += input_tokens
-                        metrics.extract_completion_tokens += output_tokens
-                        metrics.extract_inference_time_ms += time_ms
-                    elif method == "observe":
-                        metrics.observe_prompt_tokens += input_tokens
-                        metrics.observe_completion_tokens += output_tokens
-                        metrics.observe_inference_time_ms += time_ms
-                    elif method == "agent":
-                        metrics.agent_prompt_tokens += input_tokens
-                        metrics.agent_completion_tokens += output_tokens
-                        metrics.agent_inference_time_ms += time_ms
-
-                    # Always update totals for any method with token usage
-                    metrics.total_prompt_tokens += input_tokens
-                    metrics.total_completion_tokens += output_tokens
-                    metrics.total_inference_time_ms += time_ms
-
-        return metrics
+        return _parse_replay_metrics(data.get("data", {}))
+
+    except Exception as e:
+        self.logger.error(f"[EXCEPTION] Error fetching replay metrics: {str(e)}")
+        raise
+
+
+def _get_replay_metrics_sync(self):
+    """
+    Synchronous variant of _get_replay_metrics, used by the Stagehand.metrics
+    accessor when it runs inside an event loop that nest_asyncio cannot
+    re-enter (e.g. uvloop from the perf extra). Makes a one-off blocking
+    request rather than touching the shared async client, whose pooled
+    connections belong to the running loop.
+    """
+
+    if not self.session_id:
+        raise ValueError("session_id is required to fetch metrics.")
+
+    headers = {
+        "x-bb-api-key": self.browserbase_api_key,
+        "x-bb-project-id": self.browserbase_project_id,
+        "Content-Type": "application/json",
+    }
+
+    try:
+        response = httpx.get(
+            f"{self.api_url}/sessions/{self.session_id}/replay",
+            headers=headers,
+            timeout=self.timeout_settings,
+        )
+
+        if response.status_code != 200:
+            self.logger.error(
+                f"[HTTP ERROR] Failed to fetch metrics. Status {response.status_code}: {response.text}"
+            )
+            raise RuntimeError(
+                f"Failed to fetch metrics with status {response.status_code}: {response.text}"
+            )
+
+        data = response.json()
+
+        if not data.get("success"):
+            raise RuntimeError(
+                f"Failed to fetch metrics: {data.get('error', 'Unknown error')}"
+            )
+
+        return _parse_replay_metrics(data.get("data", {}))
 
     except Exception as e:
         self.logger.error(f"[EXCEPTION] Error fetching replay metrics: {str(e)}")
         raise
+
+
+def _parse_replay_metrics(api_data: dict[str, Any]) -> StagehandMetrics:
+    """Parse the replay API payload into StagehandMetrics."""
+    metrics = StagehandMetrics()
+
+    # Parse pages and their actions
+    pages = api_data.get("pages", [])
+    for page in pages:
+        actions = page.get("actions", [])
+        for action in actions:
+            # Get method name and token usage
+            method = action.get("method", "").lower()
+            token_usage = action.get("tokenUsage", {})
+
+            if token_usage:
+                input_tokens = token_usage.get("inputTokens", 0)
+                output_tokens = token_usage.get("outputTokens", 0)
+                time_ms = token_usage.get("timeMs", 0)
+
+                # Map method to metrics fields
+                if method == "act":
+                    metrics.act_prompt_tokens += input_tokens
+                    metrics.act_completion_tokens += output_tokens
+                    metrics.act_inference_time_ms += time_ms
+                elif method == "extract":
+                    metrics.extract_prompt_tokens += input_tokens
+                    metrics.extract_completion_tokens += output_tokens
+                    metrics.extract_inference_time_ms += time_ms
+                elif method == "observe":
+                    metrics.observe_prompt_tokens += input_tokens
+                    metrics.observe_completion_tokens += output_tokens
+                    metrics.observe_inference_time_ms += time_ms
+                elif method == "agent":
+                    metrics.agent_prompt_tokens += input_tokens
+                    metrics.agent_completion_tokens += output_tokens
+                    metrics.agent_inference_time_ms += time_ms
+
+                # Always update totals for any method with token usage
+                metrics.total_prompt_tokens += input_tokens
+                metrics.total_completion_tokens += output_tokens
+                metrics.total_inference_time_ms += time_ms
+
+    return metrics
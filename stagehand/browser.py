@@ -1,4 +1,4 @@
-import json
+import asyncio
 import os
 import shutil
 import tempfile
@@ -17,6 +17,28 @@ from .context import StagehandContext
 from .logging import StagehandLogger
 from .page import StagehandPage
 
+BROWSERBASE_API_URL = "https://api.browserbase.com/v1"
+
+# Packaged template for the Default/Preferences file written into temporary
+# user data dirs; copied as-is instead of re-serializing the constant dict
+# on every cold launch.
+DEFAULT_PREFS_PATH = os.path.join(os.path.dirname(__file__), "default_prefs.json")
+
+# Browserbase SDK clients cached per API key. Each client owns an HTTP
+# connection pool, so reusing one across Stagehand instances keeps session
+# creation on warm keep-alive connections instead of rebuilding the pool
+# on every init().
+_browserbase_clients: dict[str, Browserbase] = {}
+
+
+def _get_browserbase(api_key: str) -> Browserbase:
+    """Return the cached Browserbase client for this API key, creating it on first use."""
+    client = _browserbase_clients.get(api_key)
+    if client is None:
+        client = Browserbase(api_key=api_key)
+        _browserbase_clients[api_key] = client
+    return client
+
 
 async def connect_browserbase_browser(
     playwright: Playwright,
@@ -38,16 +60,30 @@ async def connect_browserbase_browser(
     Returns:
         tuple of (browser, context, stagehand_context, page)
     """
-    # Connect to remote browser via Browserbase SDK and CDP
-    bb = Browserbase(api_key=browserbase_api_key)
+    # Connect to remote browser via the Browserbase API and CDP
     try:
         if session_id:
-            session = bb.sessions.retrieve(session_id)
-            if session.status != "RUNNING":
+            # Fetch session metadata over the pooled async client rather than
+            # the sync Browserbase SDK, which would block the event loop for a
+            # full round-trip to the Browserbase API.
+            response = await stagehand_instance._client.get(
+                f"{BROWSERBASE_API_URL}/sessions/{session_id}",
+                headers={"X-BB-API-Key": browserbase_api_key},
+            )
+            if response.status_code != 200:
                 raise RuntimeError(
-                    f"Browserbase session {session_id} is not running (status: {session.status})"
+                    f"Failed to retrieve Browserbase session {session_id}: "
+                    f"status {response.status_code}: {response.text}"
                 )
+            session_data = response.json()
+            session_status = session_data.get("status")
+            if session_status != "RUNNING":
+                raise RuntimeError(
+                    f"Browserbase session {session_id} is not running (status: {session_status})"
+                )
+            connect_url = session_data.get("connectUrl")
         else:
+            bb = _get_browserbase(browserbase_api_key)
             browserbase_session_create_params = (
                 BrowserbaseSessionCreateParams(
                     project_id=stagehand_instance.browserbase_project_id,
@@ -65,7 +101,7 @@ async def connect_browserbase_browser(
             if not session.id:
                 raise Exception("Could not create Browserbase session")
             stagehand_instance.session_id = session.id
-        connect_url = session.connectUrl
+            connect_url = session.connectUrl
     except Exception as e:
         logger.error(f"Error retrieving or validating Browserbase session: {str(e)}")
         raise
@@ -155,18 +191,19 @@ async def connect_local_browser(
             user_data_dir = temp_user_data_dir
             # Create Default profile directory and Preferences file like in TS
             default_profile_path = user_data_dir / "Default"
-            default_profile_path.mkdir(parents=True, exist_ok=True)
             prefs_path = default_profile_path / "Preferences"
-            default_prefs = {"plugins": {"always_open_pdf_externally": True}}
             try:
-                with open(prefs_path, "w") as f:
-                    json.dump(default_prefs, f)
+                # mkdtemp just created user_data_dir, so a bare mkdir covers
+                # the single Default level without the existence checks that
+                # mkdir(parents=True, exist_ok=True) performs.
+                os.mkdir(default_profile_path)
+                shutil.copyfile(DEFAULT_PREFS_PATH, prefs_path)
                 logger.debug(
                     f"Created temporary user_data_dir with default preferences: {user_data_dir}"
                 )
             except Exception as e:
                 logger.error(
-                    f"Failed to write default preferences to {prefs_path}: {e}"
+                    f"Failed to set up default profile at {default_profile_path}: {e}"
                 )
 
         downloads_path_option = local_browser_launch_options.get("downloads_path")
@@ -180,7 +217,9 @@ async def connect_local_browser(
         except Exception as e:
             logger.error(f"Failed to create downloads_path {downloads_path}: {e}")
 
-        # Prepare Launch Options (translate keys if needed)
+        # Prepare Launch Options (translate keys if needed). Built in a single
+        # pass: every key except proxy has a non-None default, so only proxy
+        # needs a conditional insert rather than a full None-stripping rebuild.
         launch_options = {
             "headless": local_browser_launch_options.get("headless", False),
             "accept_downloads": local_browser_launch_options.get(
@@ -201,12 +240,13 @@ async def connect_local_browser(
                 "timezoneId", "America/New_York"
             ),
             "bypass_csp": local_browser_launch_options.get("bypassCSP", True),
-            "proxy": local_browser_launch_options.get("proxy"),
             "ignore_https_errors": local_browser_launch_options.get(
                 "ignoreHTTPSErrors", True
             ),
         }
-        launch_options = {k: v for k, v in launch_options.items() if v is not None}
+        proxy = local_browser_launch_options.get("proxy")
+        if proxy is not None:
+            launch_options["proxy"] = proxy
 
         # Launch Context
         try:
@@ -227,7 +267,8 @@ async def connect_local_browser(
                     pass
             raise
 
-        cookies = local_browser_launch_options.get("cookies")
+        # Cookies were converted to camelCase once in Stagehand.__init__
+        cookies = getattr(stagehand_instance, "_prepared_cookies", None)
         if cookies:
             try:
                 await context.add_cookies(cookies)
@@ -250,10 +291,9 @@ async def connect_local_browser(
     return browser, context, stagehand_context, page, temp_user_data_dir
 
 
-async def apply_stealth_scripts(context: BrowserContext, logger: StagehandLogger):
-    """Applies JavaScript init scripts to make the browser less detectable."""
-    logger.debug("Applying stealth scripts to the context...")
-    stealth_script = """
+# Stealth init script applied to every local context. Kept at module scope so
+# the function body is a single add_init_script call.
+_STEALTH_SCRIPT = """
     (() => {
         // Override navigator.webdriver
         if (navigator.webdriver) {
@@ -297,8 +337,23 @@ async def apply_stealth_scripts(context: BrowserContext, logger: StagehandLogger
         }
     })();
     """
+
+# Minified once at import: comment-only lines and indentation are dropped but
+# newlines are kept, so the transformation cannot change JS semantics. The
+# script rides in the CDP addScriptToEvaluateOnNewDocument payload for every
+# new page/frame in a session, so the smaller literal pays repeatedly.
+_STEALTH_SCRIPT_MIN = "\n".join(
+    stripped
+    for line in _STEALTH_SCRIPT.splitlines()
+    if (stripped := line.strip()) and not stripped.startswith("//")
+)
+
+
+async def apply_stealth_scripts(context: BrowserContext, logger: StagehandLogger):
+    """Applies JavaScript init scripts to make the browser less detectable."""
+    logger.debug("Applying stealth scripts to the context...")
     try:
-        await context.add_init_script(stealth_script)
+        await context.add_init_script(_STEALTH_SCRIPT_MIN)
     except Exception as e:
         logger.error(f"Failed to add stealth init script: {str(e)}")
 
@@ -333,21 +388,20 @@ async def cleanup_browser_resources(
         except Exception as e:
             logger.error(f"Error closing browser: {str(e)}")
 
-    # Clean up temporary user data directory if created
+    # The temp-profile removal and the Playwright shutdown are independent
+    # once the context and browser are closed, so submit both and reap the
+    # completions instead of serializing them; return_exceptions keeps one
+    # failure from cancelling the other. Chromium profiles hold thousands of
+    # small files, so the rmtree runs in a worker thread rather than stalling
+    # the event loop for the whole walk.
+    final_steps = []
     if temp_user_data_dir:
-        try:
-            logger.debug(
-                f"Removing temporary user data directory: {temp_user_data_dir}"
-            )
-            shutil.rmtree(temp_user_data_dir)
-        except Exception as e:
-            logger.error(
-                f"Error removing temporary directory {temp_user_data_dir}: {str(e)}"
-            )
-
+        logger.debug(f"Removing temporary user data directory: {temp_user_data_dir}")
+        final_steps.append(asyncio.to_thread(shutil.rmtree, temp_user_data_dir))
     if playwright:
-        try:
-            logger.debug("Stopping Playwright...")
-            await playwright.stop()
-        except Exception as e:
-            logger.error(f"Error stopping Playwright: {str(e)}")
+        logger.debug("Stopping Playwright...")
+        final_steps.append(playwright.stop())
+    if final_steps:
+        for result in await asyncio.gather(*final_steps, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error during final browser cleanup: {str(result)}")
@@ -1,12 +1,22 @@
 import os
+from enum import Enum
 from typing import Any, Callable, Literal, Optional
 
 from browserbase.types import SessionCreateParams as BrowserbaseSessionCreateParams
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from stagehand.schemas import AvailableModel
 
 
+class StagehandEnv(str, Enum):
+    """Normalized environment type. Comparisons against the members avoid
+    re-uppercasing and re-validating the raw config string on every check,
+    while str inheritance keeps equality with plain "BROWSERBASE"/"LOCAL"."""
+
+    BROWSERBASE = "BROWSERBASE"
+    LOCAL = "LOCAL"
+
+
 class StagehandConfig(BaseModel):
     """
     Configuration for the Stagehand client.
@@ -100,6 +110,11 @@ class StagehandConfig(BaseModel):
         alias="systemPrompt",
         description="System prompt to use for LLM interactions",
     )
+    act_timeout_ms: Optional[int] = Field(
+        None,
+        alias="actTimeoutMs",
+        description="Timeout for act commands (in ms)",
+    )
     local_browser_launch_options: Optional[dict[str, Any]] = Field(
         {},
         alias="localBrowserLaunchOptions",
@@ -118,6 +133,12 @@ class StagehandConfig(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)
 
+    # Caches for the serialized and camelCased forms of
+    # browserbase_session_create_params, computed at most once per config even
+    # when the config is shared across many Stagehand instances.
+    _serialized_bb_params: Optional[Any] = PrivateAttr(default=None)
+    _camel_bb_params: Optional[Any] = PrivateAttr(default=None)
+
     def with_overrides(self, **overrides) -> "StagehandConfig":
         """
         Create a new config instance with the specified overrides.
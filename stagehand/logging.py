@@ -243,6 +243,16 @@ class StagehandLogger:
         """Get external logger from config"""
         return self.config.external_logger
 
+    def is_enabled(self, level: int) -> bool:
+        """
+        Return True if a message at this verbosity level would be emitted.
+
+        Callers on hot paths can use this to skip building expensive log
+        messages (f-string interpolation, repr of large payloads) that
+        log() would immediately drop.
+        """
+        return self.config.should_log(level)
+
     def _set_verbosity(self, level: int):
         """Set the logger verbosity level"""
         self.config.verbose = level
@@ -649,6 +659,53 @@ class StagehandLogger:
         self.log(message, level=2, category=category, auxiliary=auxiliary)
 
 
+class _NullLogger:
+    """
+    No-op stand-in for StagehandLogger used when logging is fully disabled
+    (verbose=0, no external logger, no Rich output). Skips LogConfig and
+    console construction entirely, which matters when many short-lived
+    Stagehand instances are created, e.g. in test suites.
+    """
+
+    verbose = 0
+
+    def is_enabled(self, level: int) -> bool:
+        return False
+
+    def log(
+        self,
+        message: str,
+        level: int = 1,
+        category: str = None,
+        auxiliary: dict[str, Any] = None,
+    ):
+        pass
+
+    def error(
+        self, message: str, category: str = None, auxiliary: dict[str, Any] = None
+    ):
+        pass
+
+    def warning(
+        self, message: str, category: str = None, auxiliary: dict[str, Any] = None
+    ):
+        pass
+
+    def info(
+        self, message: str, category: str = None, auxiliary: dict[str, Any] = None
+    ):
+        pass
+
+    def debug(
+        self, message: str, category: str = None, auxiliary: dict[str, Any] = None
+    ):
+        pass
+
+
+# Shared instance; the class is stateless so one object serves every client.
+_null_logger = _NullLogger()
+
+
 def sync_log_handler(log_data: dict[str, Any]) -> None:
     """
     Enhanced log handler for messages from the Stagehand server.
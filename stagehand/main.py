@@ -3,8 +3,12 @@ import os
 import signal
 import sys
 import time
+import weakref
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from .agent import Agent
 
 import httpx
 import nest_asyncio
@@ -16,23 +20,103 @@ from playwright.async_api import (
 )
 from playwright.async_api import Page as PlaywrightPage
 
-from .agent import Agent
-from .api import _create_session, _execute, _get_replay_metrics
-from .browser import (
-    cleanup_browser_resources,
-    connect_browserbase_browser,
-    connect_local_browser,
+from .api import (
+    _create_session,
+    _execute,
+    _get_replay_metrics,
+    _get_replay_metrics_sync,
 )
-from .config import StagehandConfig, default_config
+from .config import StagehandConfig, StagehandEnv, default_config
 from .context import StagehandContext
-from .llm import LLMClient
-from .logging import StagehandLogger, default_log_handler
-from .metrics import StagehandFunctionName, StagehandMetrics
+from .logging import StagehandLogger, _null_logger, default_log_handler
+from .metrics import MetricsBucket, StagehandFunctionName, StagehandMetrics
 from .page import StagehandPage
-from .utils import get_download_path, make_serializable
+from .utils import (
+    convert_dict_keys_to_camel_case,
+    get_download_path,
+    make_serializable,
+)
+
+try:
+    # Optional: swap in uvloop's libuv-based event loop for lower per-await
+    # overhead and faster socket I/O. Not available on Windows; the stdlib
+    # loop is used wherever uvloop is not installed. nest_asyncio cannot
+    # patch uvloop loops, so the metrics accessor in __getattribute__ takes
+    # a synchronous fallback path when it finds one running.
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
 
 load_dotenv()
 
+# Environment-derived defaults resolved once at import (right after
+# load_dotenv) instead of per Stagehand instance. os.getenv stays as a
+# fallback in __init__ so variables exported after import are still seen.
+_DEFAULT_MODEL_API_KEY = os.getenv("MODEL_API_KEY")
+_DEFAULT_BROWSERBASE_API_KEY = os.getenv("BROWSERBASE_API_KEY")
+_DEFAULT_BROWSERBASE_PROJECT_ID = os.getenv("BROWSERBASE_PROJECT_ID")
+
+# Server log level names mapped to internal verbosity levels, hoisted out of
+# _handle_log which runs once per streamed log frame.
+_LOG_LEVEL_MAP = {
+    "debug": 3,
+    "info": 1,
+    "warning": 2,
+    "error": 0,
+}
+
+# Function names (upper and lower case) resolved to their enum members once,
+# so per-LLM-call metrics dispatch is a dict lookup instead of
+# getattr(..., name.upper()) inside a try/except.
+_FUNC_NAME_MAP = {
+    name: member
+    for member in StagehandFunctionName
+    for name in (member.name, member.name.lower())
+}
+
+# Process-wide HTTP clients shared by all Stagehand instances, one per API
+# host. Pooling the connections here means concurrent sessions reuse TCP/TLS
+# connections to the Stagehand server instead of each instance re-negotiating
+# its own, and the base_url lets request paths stay relative.
+_shared_httpx_clients: dict[str, httpx.AsyncClient] = {}
+_SHARED_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=40,
+    keepalive_expiry=60.0,
+)
+
+try:
+    # HTTP/2 lets concurrent _execute streams to the Stagehand API multiplex
+    # over one TLS connection instead of one socket each. httpx needs the h2
+    # package for this; fall back to HTTP/1.1 where it isn't installed.
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+
+def _get_shared_httpx_client(api_url: str, timeout: httpx.Timeout) -> httpx.AsyncClient:
+    """
+    Return the process-wide pooled httpx.AsyncClient for this API host,
+    creating it on first use.
+
+    The first caller's timeout settings are applied to the client; construction
+    is synchronous, so no locking is needed under the GIL.
+    """
+    client = _shared_httpx_clients.get(api_url)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=api_url,
+            timeout=timeout,
+            limits=_SHARED_CLIENT_LIMITS,
+            http2=_HTTP2_AVAILABLE,
+        )
+        _shared_httpx_clients[api_url] = client
+    return client
+
 
 class LivePageProxy:
     """
@@ -131,9 +215,36 @@ class Stagehand:
     Main Stagehand class.
     """
 
-    _session_locks = {}
+    # Weak values so a session's lock is reclaimed once nothing holds it,
+    # instead of accumulating forever in a class-level dict.
+    _session_locks = weakref.WeakValueDictionary()
     _cleanup_called = False
 
+    # Metric field names per function, so update_metrics is a single table
+    # lookup instead of an if/elif cascade on every LLM response.
+    _METRIC_FIELDS = {
+        StagehandFunctionName.ACT: (
+            "act_prompt_tokens",
+            "act_completion_tokens",
+            "act_inference_time_ms",
+        ),
+        StagehandFunctionName.EXTRACT: (
+            "extract_prompt_tokens",
+            "extract_completion_tokens",
+            "extract_inference_time_ms",
+        ),
+        StagehandFunctionName.OBSERVE: (
+            "observe_prompt_tokens",
+            "observe_completion_tokens",
+            "observe_inference_time_ms",
+        ),
+        StagehandFunctionName.AGENT: (
+            "agent_prompt_tokens",
+            "agent_completion_tokens",
+            "agent_inference_time_ms",
+        ),
+    }
+
     def __init__(
         self,
         config: StagehandConfig = default_config,
@@ -162,48 +273,105 @@ class Stagehand:
         # Handle non-config parameters
         self.api_url = self.config.api_url
 
-        # Handle model-related settings
-        self.model_client_options = self.config.model_client_options or {}
-        self.model_api_key = self.config.model_api_key or os.getenv("MODEL_API_KEY")
+        # Handle model-related settings. Resolved in one pass: the api key
+        # flows into the client options (copied so a shared config's dict is
+        # never mutated), or is backfilled from them when only the options
+        # carry it.
+        self.model_api_key = (
+            self.config.model_api_key
+            or _DEFAULT_MODEL_API_KEY
+            or os.getenv("MODEL_API_KEY")
+        )
+        model_client_options = self.config.model_client_options
+        if self.model_api_key:
+            self.model_client_options = {
+                **(model_client_options or {}),
+                "apiKey": self.model_api_key,
+            }
+        else:
+            self.model_client_options = model_client_options or {}
+            self.model_api_key = self.model_client_options.get("apiKey")
 
         self.model_name = self.config.model_name
 
         # Extract frequently used values from config for convenience
-        self.browserbase_api_key = self.config.api_key or os.getenv(
-            "BROWSERBASE_API_KEY"
+        self.browserbase_api_key = (
+            self.config.api_key
+            or _DEFAULT_BROWSERBASE_API_KEY
+            or os.getenv("BROWSERBASE_API_KEY")
         )
-        self.browserbase_project_id = self.config.project_id or os.getenv(
-            "BROWSERBASE_PROJECT_ID"
+        self.browserbase_project_id = (
+            self.config.project_id
+            or _DEFAULT_BROWSERBASE_PROJECT_ID
+            or os.getenv("BROWSERBASE_PROJECT_ID")
         )
         self.session_id = self.config.browserbase_session_id
         self.dom_settle_timeout_ms = self.config.dom_settle_timeout_ms
         self.self_heal = self.config.self_heal
         self.wait_for_captcha_solves = self.config.wait_for_captcha_solves
         self.system_prompt = self.config.system_prompt
+        self.act_timeout_ms = self.config.act_timeout_ms
         self.verbose = self.config.verbose
-        self.env = self.config.env.upper() if self.config.env else "BROWSERBASE"
+        # Normalize env once into an enum; later checks are identity
+        # comparisons instead of repeated string compares.
+        try:
+            self.env = (
+                StagehandEnv(self.config.env.upper())
+                if self.config.env
+                else StagehandEnv.BROWSERBASE
+            )
+        except ValueError:
+            raise ValueError("env must be either 'BROWSERBASE' or 'LOCAL'") from None
         self.local_browser_launch_options = (
             self.config.local_browser_launch_options or {}
         )
-        if self.model_api_key:
-            self.model_client_options["apiKey"] = self.model_api_key
-        else:
-            if "apiKey" in self.model_client_options:
-                self.model_api_key = self.model_client_options["apiKey"]
-
-        # Handle browserbase session create params
-        self.browserbase_session_create_params = make_serializable(
-            self.config.browserbase_session_create_params
+        # Pre-convert cookies to Playwright's camelCase key format once at
+        # construction instead of on every connect in init().
+        cookies = self.local_browser_launch_options.get("cookies")
+        self._prepared_cookies = (
+            [
+                convert_dict_keys_to_camel_case(cookie)
+                if isinstance(cookie, dict)
+                else cookie
+                for cookie in cookies
+            ]
+            if cookies
+            else None
         )
+        # Handle browserbase session create params; serialize once per config
+        # since configs are commonly shared across many Stagehand instances.
+        if (
+            self.config.browserbase_session_create_params is not None
+            and self.config._serialized_bb_params is None
+        ):
+            self.config._serialized_bb_params = make_serializable(
+                self.config.browserbase_session_create_params
+            )
+        self.browserbase_session_create_params = self.config._serialized_bb_params
+
+        # The camelCased form sent to /sessions/start is likewise cached on
+        # the config so re-created sessions skip the recursive key walk.
+        if (
+            self.browserbase_session_create_params is not None
+            and self.config._camel_bb_params is None
+        ):
+            self.config._camel_bb_params = convert_dict_keys_to_camel_case(
+                self.browserbase_session_create_params
+            )
+        self._bb_params_camel = self.config._camel_bb_params
 
         # Handle streaming response setting
         self.streamed_response = True
 
+        # Leave connect/pool unbounded: long-running agent/extract calls may
+        # legitimately queue for a pooled connection, and a finite pool timeout
+        # surfaces as spurious PoolTimeout errors under load. Read/write stay
+        # bounded so a hung response still fails.
         self.timeout_settings = httpx.Timeout(
-            connect=180.0,
+            connect=None,
             read=180.0,
             write=180.0,
-            pool=180.0,
+            pool=None,
         )
 
         self._local_user_data_dir_temp: Optional[Path] = (
@@ -212,22 +380,28 @@ class Stagehand:
 
         # Initialize metrics tracking
         self._local_metrics = StagehandMetrics()  # Internal storage for local metrics
-        self._inference_start_time = 0  # To track inference time
-
-        # Validate env
-        if self.env not in ["BROWSERBASE", "LOCAL"]:
-            raise ValueError("env must be either 'BROWSERBASE' or 'LOCAL'")
+        self._metric_buckets: dict[StagehandFunctionName, MetricsBucket] = {}
+        self._inference_start_ns = 0  # To track inference time
 
-        # Initialize the centralized logger with the specified verbosity
+        # Initialize the centralized logger with the specified verbosity.
+        # When logging is fully disabled, use the shared no-op logger and skip
+        # LogConfig/console construction entirely.
         self.on_log = self.config.logger or default_log_handler
-        self.logger = StagehandLogger(
-            verbose=self.verbose,
-            external_logger=self.on_log,
-            use_rich=self.config.use_rich_logging,
-        )
+        if (
+            self.verbose == 0
+            and self.config.logger is None
+            and not self.config.use_rich_logging
+        ):
+            self.logger = _null_logger
+        else:
+            self.logger = StagehandLogger(
+                verbose=self.verbose,
+                external_logger=self.on_log,
+                use_rich=self.config.use_rich_logging,
+            )
 
         # If using BROWSERBASE, session_id or creation params are needed
-        if self.env == "BROWSERBASE":
+        if self.env is StagehandEnv.BROWSERBASE:
             if not self.session_id:
                 # Check if BROWSERBASE keys are present for session creation
                 if not self.browserbase_api_key:
@@ -257,7 +431,7 @@ class Stagehand:
         # Register signal handlers for graceful shutdown
         self._register_signal_handlers()
 
-        self._client = httpx.AsyncClient(timeout=self.timeout_settings)
+        self._client = _get_shared_httpx_client(self.api_url, self.timeout_settings)
 
         self._playwright: Optional[Playwright] = None
         self._browser = None
@@ -267,7 +441,7 @@ class Stagehand:
         self.context: Optional[StagehandContext] = None
         self.use_api = self.config.use_api
         self.experimental = self.config.experimental
-        if self.env == "LOCAL":
+        if self.env is StagehandEnv.LOCAL:
             self.use_api = False
         if (
             self.browserbase_session_create_params
@@ -278,12 +452,39 @@ class Stagehand:
 
         self._initialized = False  # Flag to track if init() has run
         self._closed = False  # Flag to track if resources have been closed
+        self._cleanup_task = None  # Signal-handler cleanup task, if scheduled
+
+        # Static request headers for _execute; only x-sent-at varies per call,
+        # so it is merged in at request time instead of rebuilding the whole
+        # dict on every act/observe/extract.
+        self._execute_headers = {
+            "x-bb-api-key": self.browserbase_api_key,
+            "x-bb-project-id": self.browserbase_project_id,
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            # Always enable streaming for better log handling
+            "x-stream-response": "true",
+        }
+        if self.model_api_key:
+            self._execute_headers["x-model-api-key"] = self.model_api_key
+
+        # Resolve the session lock up front when resuming a known session so
+        # the first server request skips the creation path.
+        self._session_lock_id = self.session_id
+        self._session_lock = (
+            self._session_locks.setdefault(self.session_id, asyncio.Lock())
+            if self.session_id
+            else None
+        )
         self._live_page_proxy = None  # Live page proxy
         self._page_switch_lock = asyncio.Lock()  # Lock for page stability
 
-        # Setup LLM client if LOCAL mode
+        # Setup LLM client if LOCAL mode. Imported here so API-mode users
+        # don't pay the litellm import cost at module import time.
         self.llm = None
         if not self.use_api:
+            from .llm import LLMClient
+
             self.llm = LLMClient(
                 stagehand_logger=self.logger,
                 api_key=self.model_api_key,
@@ -323,10 +524,12 @@ class Stagehand:
                 # Schedule cleanup in the existing event loop
                 # Use call_soon_threadsafe since signal handlers run in a different thread context
                 def schedule_cleanup():
-                    task = asyncio.create_task(self._async_cleanup())
-                    # Shield the task to prevent it from being cancelled
-                    asyncio.shield(task)
-                    # We don't need to await here since we're in call_soon_threadsafe
+                    # loop.create_task works regardless of which thread the
+                    # signal fired on; keep a reference only so the task
+                    # isn't garbage collected mid-flight (close() must not
+                    # await it: the task runs close() itself and then
+                    # force-exits the process).
+                    self._cleanup_task = loop.create_task(self._async_cleanup())
 
                 loop.call_soon_threadsafe(schedule_cleanup)
 
@@ -352,13 +555,15 @@ class Stagehand:
 
     def start_inference_timer(self):
         """Start timer for tracking inference time."""
-        self._inference_start_time = time.time()
+        # Monotonic so the metrics are immune to wall-clock (NTP) jumps
+        # during long agent runs; integer ns avoids float arithmetic.
+        self._inference_start_ns = time.monotonic_ns()
 
     def get_inference_time_ms(self) -> int:
         """Get elapsed inference time in milliseconds."""
-        if self._inference_start_time == 0:
+        if self._inference_start_ns == 0:
             return 0
-        return int((time.time() - self._inference_start_time) * 1000)
+        return (time.monotonic_ns() - self._inference_start_ns) // 1_000_000
 
     def update_metrics(
         self,
@@ -376,27 +581,34 @@ class Stagehand:
             completion_tokens: Number of completion tokens used
             inference_time_ms: Time taken for inference in milliseconds
         """
-        if function_name == StagehandFunctionName.ACT:
-            self._local_metrics.act_prompt_tokens += prompt_tokens
-            self._local_metrics.act_completion_tokens += completion_tokens
-            self._local_metrics.act_inference_time_ms += inference_time_ms
-        elif function_name == StagehandFunctionName.EXTRACT:
-            self._local_metrics.extract_prompt_tokens += prompt_tokens
-            self._local_metrics.extract_completion_tokens += completion_tokens
-            self._local_metrics.extract_inference_time_ms += inference_time_ms
-        elif function_name == StagehandFunctionName.OBSERVE:
-            self._local_metrics.observe_prompt_tokens += prompt_tokens
-            self._local_metrics.observe_completion_tokens += completion_tokens
-            self._local_metrics.observe_inference_time_ms += inference_time_ms
-        elif function_name == StagehandFunctionName.AGENT:
-            self._local_metrics.agent_prompt_tokens += prompt_tokens
-            self._local_metrics.agent_completion_tokens += completion_tokens
-            self._local_metrics.agent_inference_time_ms += inference_time_ms
-
-        # Always update totals
-        self._local_metrics.total_prompt_tokens += prompt_tokens
-        self._local_metrics.total_completion_tokens += completion_tokens
-        self._local_metrics.total_inference_time_ms += inference_time_ms
+        if function_name in self._METRIC_FIELDS:
+            self.bucket_for(function_name).add(
+                prompt_tokens, completion_tokens, inference_time_ms
+            )
+        else:
+            # Unknown function: still account for the usage in the totals
+            metrics = self._local_metrics
+            metrics.total_prompt_tokens += prompt_tokens
+            metrics.total_completion_tokens += completion_tokens
+            metrics.total_inference_time_ms += inference_time_ms
+
+    def bucket_for(self, function_name: StagehandFunctionName) -> MetricsBucket:
+        """
+        Return the MetricsBucket for a function, creating it on first use.
+
+        Call sites on hot paths can hold on to the returned bucket and call
+        add() directly, skipping the per-update function-name dispatch.
+        """
+        bucket = self._metric_buckets.get(function_name)
+        if bucket is None:
+            prompt_field, completion_field, time_field = self._METRIC_FIELDS[
+                function_name
+            ]
+            bucket = MetricsBucket(
+                self._local_metrics, prompt_field, completion_field, time_field
+            )
+            self._metric_buckets[function_name] = bucket
+        return bucket
 
     def update_metrics_from_response(
         self,
@@ -413,58 +625,54 @@ class Stagehand:
             inference_time_ms: Optional inference time if already calculated
         """
         try:
-            # Check if response has usage information
-            if hasattr(response, "usage") and response.usage:
-                prompt_tokens = getattr(response.usage, "prompt_tokens", 0)
-                completion_tokens = getattr(response.usage, "completion_tokens", 0)
+            # Usage lives on response.usage for litellm model responses, or
+            # under _hidden_params for some passthrough providers. A single
+            # getattr chain with defaults replaces the hasattr/getattr
+            # cascade this ran per LLM response.
+            usage = getattr(response, "usage", None) or (
+                getattr(response, "_hidden_params", None) or {}
+            ).get("usage")
+            if not usage:
+                return
 
-                # Use provided inference time or calculate from timer
-                time_ms = inference_time_ms or self.get_inference_time_ms()
+            if isinstance(usage, dict):
+                prompt_tokens = usage.get("prompt_tokens", 0)
+                completion_tokens = usage.get("completion_tokens", 0)
+            else:
+                prompt_tokens = getattr(usage, "prompt_tokens", 0)
+                completion_tokens = getattr(usage, "completion_tokens", 0)
 
-                self.update_metrics(
-                    function_name, prompt_tokens, completion_tokens, time_ms
-                )
+            # Use provided inference time or calculate from timer
+            time_ms = inference_time_ms or self.get_inference_time_ms()
 
-                # Log the usage at debug level
+            self.update_metrics(
+                function_name, prompt_tokens, completion_tokens, time_ms
+            )
+
+            # Log the usage at debug level; skip the interpolation entirely
+            # when debug output would be dropped anyway.
+            if self.logger.is_enabled(2):
                 self.logger.debug(
                     f"Updated metrics for {function_name}: {prompt_tokens} prompt tokens, "
                     f"{completion_tokens} completion tokens, {time_ms}ms"
                 )
-                self.logger.debug(
-                    f"Total metrics: {self._local_metrics.total_prompt_tokens} prompt tokens, "
-                    f"{self._local_metrics.total_completion_tokens} completion tokens, "
-                    f"{self._local_metrics.total_inference_time_ms}ms"
-                )
-            else:
-                # Try to extract from _hidden_params or other locations
-                hidden_params = getattr(response, "_hidden_params", {})
-                if hidden_params and "usage" in hidden_params:
-                    usage = hidden_params["usage"]
-                    prompt_tokens = usage.get("prompt_tokens", 0)
-                    completion_tokens = usage.get("completion_tokens", 0)
-
-                    # Use provided inference time or calculate from timer
-                    time_ms = inference_time_ms or self.get_inference_time_ms()
-
-                    self.update_metrics(
-                        function_name, prompt_tokens, completion_tokens, time_ms
-                    )
-
-                    # Log the usage at debug level
-                    self.logger.debug(
-                        f"Updated metrics from hidden_params for {function_name}: {prompt_tokens} prompt tokens, "
-                        f"{completion_tokens} completion tokens, {time_ms}ms"
-                    )
         except Exception as e:
             self.logger.debug(f"Failed to update metrics from response: {str(e)}")
 
     def _get_lock_for_session(self) -> asyncio.Lock:
         """
         Return an asyncio.Lock for this session. If one doesn't exist yet, create it.
+
+        The resolved lock is cached on the instance (which also keeps it alive
+        in the weak-valued class map), so the steady-state path guarding every
+        server request is a single identity check instead of a dict lookup.
         """
-        if self.session_id not in self._session_locks:
-            self._session_locks[self.session_id] = asyncio.Lock()
-        return self._session_locks[self.session_id]
+        if self._session_lock is None or self._session_lock_id != self.session_id:
+            self._session_lock = self._session_locks.setdefault(
+                self.session_id, asyncio.Lock()
+            )
+            self._session_lock_id = self.session_id
+        return self._session_lock
 
     async def __aenter__(self):
         self.logger.debug("Entering Stagehand context manager (__aenter__)...")
@@ -488,17 +696,31 @@ class Stagehand:
             return
 
         self.logger.debug("Initializing Stagehand...")
-        self.logger.debug(f"Environment: {self.env}")
+        if self.logger.is_enabled(2):
+            self.logger.debug(f"Environment: {self.env}")
 
-        # Initialize Playwright with timeout
-        self._playwright = await asyncio.wait_for(
-            async_playwright().start(), timeout=30.0  # 30 second timeout
+        # Initialize Playwright with timeout. Started as a task so the local
+        # driver spawn can overlap the session-create round-trip below.
+        playwright_task = asyncio.create_task(
+            asyncio.wait_for(async_playwright().start(), timeout=30.0)
         )
 
-        if self.env == "BROWSERBASE":
-            # Create session if we don't have one
+        # Deferred so importing stagehand doesn't pay for the browser
+        # connection stack (browserbase SDK and friends) until init runs
+        from .browser import connect_browserbase_browser, connect_local_browser
+
+        if self.env is StagehandEnv.BROWSERBASE:
+            # Create session if we don't have one. This server round-trip is
+            # independent of the Playwright start-up, so the two run
+            # concurrently and init pays only the longer of the two waits.
             if self.use_api:
-                await self._create_session()  # Uses self._client and api_url
+                try:
+                    await self._create_session()  # Uses self._client and api_url
+                except Exception:
+                    playwright_task.cancel()
+                    raise
+
+            self._playwright = await playwright_task
 
             # Connect to remote browser
             try:
@@ -520,7 +742,9 @@ class Stagehand:
                 await self.close()
                 raise
 
-        elif self.env == "LOCAL":
+        elif self.env is StagehandEnv.LOCAL:
+            self._playwright = await playwright_task
+
             # Connect to local browser
             try:
                 (
@@ -542,6 +766,7 @@ class Stagehand:
                 raise
         else:
             # Should not happen due to __init__ validation
+            playwright_task.cancel()
             raise RuntimeError(f"Invalid env value: {self.env}")
 
         # Set up download behavior via CDP
@@ -563,7 +788,7 @@ class Stagehand:
 
         self._initialized = True
 
-    def agent(self, **kwargs) -> Agent:
+    def agent(self, **kwargs) -> "Agent":
         """
         Create an agent instance configured with the provided options.
 
@@ -579,7 +804,12 @@ class Stagehand:
                 "Stagehand must be initialized with await init() before creating an agent."
             )
 
-        self.logger.debug(f"Creating Agent instance with config: {kwargs}")
+        if self.logger.is_enabled(2):
+            self.logger.debug(f"Creating Agent instance with config: {kwargs}")
+        # Imported here so the provider SDKs behind the agent clients stay
+        # off the module import path until an agent is created
+        from .agent import Agent
+
         # Pass the required config directly to the Agent constructor
         return Agent(self, **kwargs)
 
@@ -594,46 +824,56 @@ class Stagehand:
 
         self.logger.debug("Closing resources...")
 
+        from .browser import cleanup_browser_resources
+
+        shutdown = []
         if self.use_api:
             # --- BROWSERBASE Cleanup (API) ---
             # End the session on the server if we have a session ID
             if self.session_id and self._client:  # Check if client was initialized
-                try:
-                    self.logger.debug(
-                        f"Attempting to end server session {self.session_id}..."
-                    )
-                    # Don't use async with here as it might close the client prematurely
-                    # The _execute method will handle the request properly
-                    result = await self._execute("end", {"sessionId": self.session_id})
-                    self.logger.debug(
-                        f"Server session {self.session_id} ended successfully with result: {result}"
-                    )
-                except Exception as e:
-                    # Log error but continue cleanup
-                    self.logger.error(
-                        f"Error ending server session {self.session_id}: {str(e)}"
-                    )
+                shutdown.append(self._end_server_session())
             elif self.session_id:
                 self.logger.warning(
                     "Cannot end server session: HTTP client not available."
                 )
 
-            if self._client:
-                self.logger.debug("Closing the internal HTTPX client...")
-                await self._client.aclose()
-                self._client = None
-
         # Use the centralized cleanup function for browser resources
-        await cleanup_browser_resources(
-            self._browser,
-            self._context,
-            self._playwright,
-            self._local_user_data_dir_temp,
-            self.logger,
+        shutdown.append(
+            cleanup_browser_resources(
+                self._browser,
+                self._context,
+                self._playwright,
+                self._local_user_data_dir_temp,
+                self.logger,
+            )
         )
 
+        # The server-session end and the local browser teardown hit
+        # independent backends, so run them concurrently; both legs log and
+        # swallow their own errors, so neither can cancel the other.
+        await asyncio.gather(*shutdown)
+
+        if self.use_api:
+            # The HTTPX client is a process-wide shared pool; leave it open so
+            # other Stagehand instances keep their keep-alive connections.
+            self._client = None
+
         self._closed = True
 
+    async def _end_server_session(self):
+        """End the session on the Stagehand server; errors are logged, not raised."""
+        try:
+            self.logger.debug(f"Attempting to end server session {self.session_id}...")
+            result = await self._execute("end", {"sessionId": self.session_id})
+            self.logger.debug(
+                f"Server session {self.session_id} ended successfully with result: {result}"
+            )
+        except Exception as e:
+            # Log error but continue cleanup
+            self.logger.error(
+                f"Error ending server session {self.session_id}: {str(e)}"
+            )
+
     async def _handle_log(self, msg: dict[str, Any]):
         """
         Handle a log message from the server.
@@ -643,49 +883,29 @@ class Stagehand:
             log_data = msg.get("data", {})
 
             # Call user-provided callback with original data if available
-            if self.on_log:
+            if self.on_log is not default_log_handler:
                 await self.on_log(log_data)
                 return  # Early return after on_log to prevent double logging
 
-            # Extract message, category, and level info
-            message = log_data.get("message", "")
-            category = log_data.get("category", "")
+            # Resolve the level first so frames the verbosity filter would
+            # drop bail out before any further parsing; chatty sessions
+            # stream many such drop-on-arrival log frames.
             level_str = log_data.get("level", "info")
-            auxiliary = log_data.get("auxiliary", {})
-
-            # Map level strings to internal levels
-            level_map = {
-                "debug": 3,
-                "info": 1,
-                "warning": 2,
-                "error": 0,
-            }
-
-            # Convert string level to int if needed
             if isinstance(level_str, str):
-                internal_level = level_map.get(level_str.lower(), 1)
+                internal_level = _LOG_LEVEL_MAP.get(level_str.lower(), 1)
             else:
                 internal_level = min(level_str, 3)  # Ensure level is between 0-3
 
-            # Handle the case where message itself might be a JSON-like object
-            if isinstance(message, dict):
-                # If message is a dict, just pass it directly to the logger
-                formatted_message = message
-            elif isinstance(message, str) and (
-                message.startswith("{") and ":" in message
-            ):
-                # If message looks like JSON but isn't a dict yet, it will be handled by _format_fastify_log
-                formatted_message = message
-            else:
-                # Regular message
-                formatted_message = message
+            if not self.logger.is_enabled(internal_level):
+                return
 
-            # Log using the structured logger
+            # Log using the structured logger, which handles dict and
+            # JSON-like string messages itself.
             self.logger.log(
-                formatted_message,
+                log_data.get("message", ""),
                 level=internal_level,
-                category=category,
-                auxiliary=auxiliary,
+                category=log_data.get("category", ""),
+                auxiliary=log_data.get("auxiliary", {}),
             )
 
         except Exception as e:
@@ -720,13 +940,12 @@ class Stagehand:
         # Default to AGENT only if no function_name is provided
         if function_name is None:
             function_enum = StagehandFunctionName.AGENT
-        # Convert string function_name to enum if needed
+        # Convert string function_name to enum if needed; unknown names
+        # default to AGENT
         elif isinstance(function_name, str):
-            try:
-                function_enum = getattr(StagehandFunctionName, function_name.upper())
-            except (AttributeError, KeyError):
-                # If conversion fails, default to AGENT
-                function_enum = StagehandFunctionName.AGENT
+            function_enum = _FUNC_NAME_MAP.get(
+                function_name, StagehandFunctionName.AGENT
+            )
         else:
             # Use the provided enum value
             function_enum = function_name
@@ -781,14 +1000,23 @@ class Stagehand:
 
                     # Try to get current event loop
                     try:
-                        asyncio.get_running_loop()
-                        # We're in an async context, need to handle this carefully
-                        # Create a new task and wait for it
-                        nest_asyncio.apply()
-                        return asyncio.run(get_replay_metrics())
+                        loop = asyncio.get_running_loop()
                     except RuntimeError:
                         # No event loop running, we can use asyncio.run directly
                         return asyncio.run(get_replay_metrics())
+
+                    if isinstance(loop, asyncio.BaseEventLoop):
+                        # We're in an async context on a stdlib loop, which
+                        # nest_asyncio can patch so asyncio.run re-enters it
+                        nest_asyncio.apply()
+                        return asyncio.run(get_replay_metrics())
+
+                    # nest_asyncio refuses to patch other loop types (e.g.
+                    # uvloop from the perf extra); fetch with a one-off
+                    # blocking request instead of re-entering the loop
+                    return object.__getattribute__(
+                        self, "_get_replay_metrics_sync"
+                    )()
                 except Exception as e:
                     # Log error and return empty metrics
                     logger = object.__getattribute__(self, "logger")
@@ -807,3 +1035,4 @@ class Stagehand:
 Stagehand._create_session = _create_session
 Stagehand._execute = _execute
 Stagehand._get_replay_metrics = _get_replay_metrics
+Stagehand._get_replay_metrics_sync = _get_replay_metrics_sync
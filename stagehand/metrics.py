@@ -37,24 +37,62 @@ class StagehandMetrics:
     total_inference_time_ms: int = 0
 
 
-def start_inference_timer() -> float:
+@dataclass
+class MetricsBucket:
+    """Accumulator bound to one function's metric fields.
+
+    Resolving the field names once lets hot call sites update their counters
+    with a single add() call, with no per-update function-name dispatch.
+    """
+
+    metrics: StagehandMetrics
+    prompt_field: str
+    completion_field: str
+    time_field: str
+
+    def add(
+        self, prompt_tokens: int, completion_tokens: int, inference_time_ms: int
+    ) -> None:
+        """Add token usage and inference time to this bucket and the totals."""
+        metrics = self.metrics
+        setattr(
+            metrics,
+            self.prompt_field,
+            getattr(metrics, self.prompt_field) + prompt_tokens,
+        )
+        setattr(
+            metrics,
+            self.completion_field,
+            getattr(metrics, self.completion_field) + completion_tokens,
+        )
+        setattr(
+            metrics,
+            self.time_field,
+            getattr(metrics, self.time_field) + inference_time_ms,
+        )
+        metrics.total_prompt_tokens += prompt_tokens
+        metrics.total_completion_tokens += completion_tokens
+        metrics.total_inference_time_ms += inference_time_ms
+
+
+def start_inference_timer() -> int:
     """Start timing inference latency.
 
     Returns:
-        The start time as a float timestamp.
+        The start time in monotonic nanoseconds, immune to wall-clock jumps.
     """
-    return time.time()
+    return time.monotonic_ns()
 
 
-def get_inference_time_ms(start_time: float) -> int:
+def get_inference_time_ms(start_time: int) -> int:
     """Get elapsed inference time in milliseconds.
 
     Args:
-        start_time: The timestamp when timing started.
+        start_time: The monotonic nanosecond timestamp when timing started.
 
     Returns:
         The elapsed time in milliseconds.
     """
     if start_time == 0:
         return 0
-    return int((time.time() - start_time) * 1000)
+    return (time.monotonic_ns() - start_time) // 1_000_000
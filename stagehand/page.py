@@ -5,10 +5,6 @@ from typing import Optional, Union
 from playwright.async_api import CDPSession, Page
 from pydantic import BaseModel
 
-from stagehand.handlers.act_handler import ActHandler
-from stagehand.handlers.extract_handler import ExtractHandler
-from stagehand.handlers.observe_handler import ObserveHandler
-
 from .schemas import (
     DEFAULT_EXTRACT_SCHEMA,
     ActOptions,
@@ -174,9 +170,15 @@ class StagehandPage:
         if not self._stagehand.use_api:
             # TODO: revisit passing user_provided_instructions
             if not hasattr(self, "_observe_handler"):
+                # Imported here to keep the LLM stack off the import path
+                # until a handler is actually needed
+                from stagehand.handlers.observe_handler import ObserveHandler
+
                 # TODO: revisit handlers initialization on page creation
                 self._observe_handler = ObserveHandler(self, self._stagehand, "")
             if not hasattr(self, "_act_handler"):
+                from stagehand.handlers.act_handler import ActHandler
+
                 self._act_handler = ActHandler(
                     self, self._stagehand, "", self._stagehand.self_heal
                 )
@@ -251,6 +253,8 @@ class StagehandPage:
             # If we don't have an observe handler yet, create one
             # TODO: revisit passing user_provided_instructions
             if not hasattr(self, "_observe_handler"):
+                from stagehand.handlers.observe_handler import ObserveHandler
+
                 self._observe_handler = ObserveHandler(self, self._stagehand, "")
 
             # Call local observe implementation
@@ -368,6 +372,8 @@ class StagehandPage:
         if not self._stagehand.use_api:
             # If we don't have an extract handler yet, create one
             if not hasattr(self, "_extract_handler"):
+                from stagehand.handlers.extract_handler import ExtractHandler
+
                 self._extract_handler = ExtractHandler(
                     self, self._stagehand, self._stagehand.system_prompt
                 )
@@ -223,7 +223,7 @@ def mock_stagehand_page(mock_playwright_page):
 def mock_stagehand_client(mock_stagehand_config):
     """Provide a mock Stagehand client for testing"""
     with patch('stagehand.main.async_playwright'), \
-         patch('stagehand.main.LLMClient'), \
+         patch('stagehand.llm.LLMClient'), \
          patch('stagehand.main.StagehandLogger'):
         
         client = Stagehand(config=mock_stagehand_config)
@@ -42,11 +42,11 @@ class TestFrameIdIntegration:
             mock_stream_response.__aenter__ = AsyncMock(return_value=mock_stream_response)
             mock_stream_response.__aexit__ = AsyncMock()
             
-            # Mock the async iterator for streaming lines
-            async def mock_aiter_lines():
-                yield 'data: {"type": "system", "data": {"status": "finished", "result": {"success": true}}}'
-            
-            mock_stream_response.aiter_lines = mock_aiter_lines
+            # Mock the async iterator for the raw byte stream
+            async def mock_aiter_bytes(chunk_size=None):
+                yield b'data: {"type": "system", "data": {"status": "finished", "result": {"success": true}}}\n'
+
+            mock_stream_response.aiter_bytes = mock_aiter_bytes
             mock_client.stream = MagicMock(return_value=mock_stream_response)
             
             # Initialize Stagehand
@@ -8,6 +8,36 @@ from httpx import AsyncClient, Response
 from stagehand import Stagehand
 
 
+class FakeStreamResponse:
+    """Scripted streaming response yielding a fixed chunk sequence."""
+
+    def __init__(self, status_code, chunks):
+        self.status_code = status_code
+        self._chunks = chunks
+        self.chunks_consumed = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def aiter_bytes(self, chunk_size=None):
+        for chunk in self._chunks:
+            self.chunks_consumed += 1
+            yield chunk
+
+
+class FakeStreamClient:
+    """Stands in for the httpx client, returning a scripted stream response."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def stream(self, method, url, **kwargs):
+        return self._response
+
+
 class TestClientAPI:
     """Tests for the Stagehand client API interactions."""
 
@@ -51,6 +81,53 @@ class TestClientAPI:
         # Verify result matches the expected value
         assert result == {"key": "value"}
 
+    @pytest.mark.asyncio
+    async def test_execute_stream_chunk_boundaries(self, mock_client):
+        """Test the real _execute against a stream with awkward chunk boundaries."""
+        # Frames arrive split mid-line, with CRLF keep-alive frames in
+        # between and a trailing finished frame that has no newline.
+        chunks = [
+            b'data: {"type": "log", "data": {"message": "first"}}\ndata: {"ty',
+            b'pe": "log", "data": {"message": "second"}}\n',
+            b"\r\n\r\n",
+            b'data: {"type": "system", "data": {"status": "finished", "result": {"key": "value"}}}',
+        ]
+        mock_client._client = FakeStreamClient(FakeStreamResponse(200, chunks))
+
+        # Track the log frames _execute dispatches
+        log_calls = []
+
+        async def mock_handle_log(message):
+            log_calls.append(message)
+
+        mock_client._handle_log = mock_handle_log
+
+        result = await mock_client._execute("test_method", {"param": "value"})
+
+        # The finished frame's result comes through despite the split frames
+        assert result == {"key": "value"}
+
+        # Both log frames were reassembled across the chunk boundary
+        assert [call["data"]["message"] for call in log_calls] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_execute_error_body_capped(self, mock_client):
+        """Test that _execute reads at most 8KB of a non-200 error body."""
+        # A 20KB error body delivered in 1KB chunks; _execute should stop
+        # reading once it has 8KB rather than buffering the whole body.
+        chunks = [b"x" * 1000 for _ in range(20)]
+        response = FakeStreamResponse(500, chunks)
+        mock_client._client = FakeStreamClient(response)
+
+        with pytest.raises(RuntimeError, match="Request failed with status 500") as exc_info:
+            await mock_client._execute("test_method", {"param": "value"})
+
+        # The error message carries exactly the 8KB cap of the body
+        assert str(exc_info.value).count("x") == 8192
+
+        # Reading stopped at the cap instead of draining all 20 chunks
+        assert response.chunks_consumed == 9
+
     @pytest.mark.asyncio
     async def test_execute_error_response(self, mock_client):
         """Test handling of error responses."""